@@ -4,7 +4,7 @@ set -e
 mkdir -p ~/.emulationstation/themes
 
 echo "Installing Python dependencies..."
-python3 -m pip install --no-warn-script-location opencv-python requests rich pillow lxml imagehash
+python3 -m pip install --no-warn-script-location opencv-python requests rich pillow lxml imagehash numpy scipy
 
 echo "Setting up EmulationStation configuration..."
 python3 "$WORKSPACE_DIR/_tools/setup_es_config.py" /home/dev/.emulationstation/es_systems.cfg  /home/dev/.emulationstation/gamelists /opt/roms
@@ -5,14 +5,25 @@ from rich.spinner import Spinner
 from rich.markup import escape
 from rich.console import Console
 from rich.padding import Padding
-from rich.traceback import Traceback
+from rich.traceback import Trace, Traceback
 from dataclasses import dataclass
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 import tempfile
 import subprocess
 from PIL import Image
 import imagehash
-from typing import Protocol, Generator
+import numpy as np
+import scipy.fft
+from typing import Callable, Iterable, Protocol, Generator, TypeVar
+import os
 import sys
+import json
+import functools
+import hashlib
 import lxml.etree
 import re
 
@@ -37,6 +48,43 @@ class Fix:
 Result = Success | Failure | Fix
 
 
+class CheckError(Exception):
+    """An exception raised by a check, with its traceback extracted for display."""
+
+    def __init__(self, trace: Trace):
+        super().__init__(trace)
+        self.trace = trace
+
+
+T = TypeVar("T")
+
+# Parsers are reused across files. Each worker process gets its own copy and only
+# uses it from a single thread, as lxml requires.
+_SVG_PARSER = lxml.etree.XMLParser(
+    remove_comments=False,
+    no_network=True,
+    remove_blank_text=False,
+)
+
+# Using `lxml` over `xml` built-in module because it can preserve root comments.
+_XML_PARSER = lxml.etree.XMLParser(remove_comments=False, no_network=True)
+
+_INKSCAPE_CSS_RE = re.compile(r"-inkscape-[^;]+;?\s*")
+
+_UNIT_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz%")
+
+# Conversion factors from SVG length units to user units (px).
+_UNIT_FACTORS = {
+    "": 1.0,
+    "px": 1.0,
+    "pt": 1.25,
+    "pc": 15.0,
+    "in": 96.0,
+    "cm": 96 / 2.54,
+    "mm": 96 / 25.4,
+}
+
+
 class CheckFunction(Protocol):
     __doc__: str
 
@@ -48,24 +96,126 @@ def _base_dir() -> Path:
     return Path(__file__).parent.parent
 
 
-def _iter_files(folder_type: str):
+@functools.lru_cache(maxsize=None)
+def _iter_files(folder_type: str) -> tuple[Path, ...]:
+    """List the files of an `_inc` folder, caching the listing for later checks."""
     dir = _base_dir() / "_inc" / folder_type
     if not dir.exists():
         raise ValueError(f"Invalid folder: {folder_type}")
-    for node in dir.iterdir():
-        if not node.is_file():
-            raise ValueError(f"Found unexpected non-file: {node}")
-        if node.name.startswith("_"):
-            continue
-        yield node
+    files: list[Path] = []
+    # `os.scandir` gets file types from the directory listing, saving a `stat` each.
+    with os.scandir(dir) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                raise ValueError(f"Found unexpected non-file: {entry.path}")
+            if entry.name.startswith("_"):
+                continue
+            files.append(Path(entry.path))
+    return tuple(files)
 
 
 def _find_files(ext: str):
-    dir = _base_dir() / "_inc"
-    yield from dir.glob(f"**/*.{ext.lstrip('.')}")
+    suffix = f".{ext.lstrip('.')}"
+    stack = [_base_dir() / "_inc"]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    yield Path(entry.path)
+
+
+def _map_files(
+    func: Callable[[Path], T],
+    files: Iterable[Path],
+    chunksize: int = 8,
+    executor_type: type[Executor] = ProcessPoolExecutor,
+):
+    """Apply `func` to each file in a pool of workers, yielding results in order."""
+    with executor_type() as executor:
+        yield from executor.map(func, list(files), chunksize=chunksize)
+
+
+def _cache_file(name: str) -> Path:
+    return _base_dir() / ".cache" / f"{name}.json"
+
+
+def _load_cache(name: str) -> dict:
+    """Load data saved by previous runs, or an empty dict if there is none."""
+    try:
+        with open(_cache_file(name), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cache(name: str, data: dict):
+    cache_file = _cache_file(name)
+    cache_file.parent.mkdir(exist_ok=True)
+    with open(cache_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def _content_digest(filepath: Path) -> str:
+    with open(filepath, "rb") as file:
+        return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _formatter_fingerprint() -> str:
+    """Identify the formatting rules, so files cached as formatted get rechecked."""
+    with open(__file__, "rb") as file:
+        source = file.read()
+    return hashlib.blake2b(
+        source + lxml.etree.__version__.encode(), digest_size=16
+    ).hexdigest()
+
+
+def _map_formatter(
+    format_file: Callable[[Path], Result], files: Iterable[Path], cache_name: str
+):
+    """Apply `format_file` to the files whose content wasn't formatted in a past run."""
+    cache = _load_cache(cache_name)
+    fingerprint = _formatter_fingerprint()
+    known: set[str] = set()
+    if cache.get("formatter") == fingerprint:
+        known.update(cache.get("formatted", []))
+
+    files = list(files)
+    digests = [_content_digest(filepath) for filepath in files]
+    pending = [f for f, digest in zip(files, digests) if digest not in known]
+
+    results = {
+        result.file: result for result in _map_files(format_file, pending, chunksize=16)
+    }
+
+    formatted: set[str] = set()
+
+    for filepath, digest in zip(files, digests):
+        result = results.get(filepath, Success(filepath))
+
+        if type(result) is Success:
+            formatted.add(digest)
+        elif type(result) is Fix:
+            formatted.add(_content_digest(filepath))
+
+        yield result
+
+    _save_cache(cache_name, {"formatter": fingerprint, "formatted": sorted(formatted)})
 
 
-def _run_check(check: CheckFunction):
+def _collect_results(check: CheckFunction) -> list[Result]:
+    try:
+        return list(check() or [])
+    except Exception as e:
+        # Traceback objects can't be sent back from worker processes, so the frames
+        # are extracted here, where the check actually failed.
+        trace = Traceback.extract(type(e), e, e.__traceback__)
+        raise CheckError(trace) from None
+
+
+def _run_check(check: CheckFunction, get_results: Callable[[], list[Result]]):
     description = escape(check.__doc__)
     spinner = Spinner("dots", style="blue", text=f"[blue]{description}[/]")
 
@@ -75,18 +225,15 @@ def _run_check(check: CheckFunction):
 
     console = Console(highlighter=None)
 
+    buckets: dict[type, list] = {Success: successes, Fix: fixes, Failure: failures}
+
     raised_exception: Exception | None = None
 
     with Live(spinner, console=console) as live:
         try:
-            results = check() or []
+            results = get_results()
             for result in results:
-                if type(result) is Success:
-                    successes.append(result)
-                elif type(result) is Fix:
-                    fixes.append(result)
-                elif type(result) is Failure:
-                    failures.append(result)
+                buckets[type(result)].append(result)
         except Exception as e:
             raised_exception = e
 
@@ -109,7 +256,12 @@ def _run_check(check: CheckFunction):
         relpath_parents = path.parent.relative_to(_base_dir())
         return f"[dim]{relpath_parents}/[/dim][b]{path.name}[/b]"
 
-    if raised_exception is not None:
+    if isinstance(raised_exception, CheckError):
+        tb = Traceback(raised_exception.trace)
+        padded_tb = Padding(tb, (0, 4))
+        console.print(padded_tb)
+        return False
+    elif raised_exception is not None:
         tb = Traceback.from_exception(
             type(raised_exception), raised_exception, raised_exception.__traceback__
         )
@@ -133,156 +285,157 @@ def _run_check(check: CheckFunction):
         return False
 
 
-def check_svg_formatting():
-    """Check that SVG files are properly formatted."""
-    for filepath in _find_files(".svg"):
-        with open(filepath, "rb") as file:
-            svg_content = file.read()
+def _format_svg_file(filepath: Path) -> Result:
+    with open(filepath, "rb") as file:
+        svg_content = file.read()
 
-        parser = lxml.etree.XMLParser(
-            remove_comments=False,
-            no_network=True,
-            remove_blank_text=False,
-        )
+    try:
+        tree = lxml.etree.fromstring(svg_content, parser=_SVG_PARSER)
+    except Exception as e:
+        return Failure(filepath, f"Could not parse SVG file: {e}")
 
-        try:
-            tree = lxml.etree.fromstring(svg_content, parser=parser)
-        except Exception as e:
-            yield Failure(filepath, f"Could not parse SVG file: {e}")
+    svg = lxml.etree.ElementTree(tree)
+    root = svg.getroot()
+
+    inkscape_elements = []
+
+    for el in root.iter(lxml.etree.Element):
+        if el.prefix in ("sodipodi", "inkscape"):
+            inkscape_elements.append(el)
+
+        to_remove = [a for a in el.attrib if "inkscape" in a or "sodipodi" in a]
+        for attr in to_remove:
+            del el.attrib[attr]
+
+        style_text = el.get("style")
+
+        if style_text is None:
             continue
 
-        svg = lxml.etree.ElementTree(tree)
-        root = svg.getroot()
+        new_style = _INKSCAPE_CSS_RE.sub("", style_text).strip()
 
-        for el in root.xpath(
-            "//*[starts-with(name(), 'sodipodi:') or starts-with(name(), 'inkscape:')]"
-        ):
-            el.getparent().remove(el)
+        new_style = new_style.rstrip(";")
 
-        for el in root.xpath("//*"):
-            to_remove = [a for a in el.attrib if "inkscape" in a or "sodipodi" in a]
-            for attr in to_remove:
-                del el.attrib[attr]
+        if new_style:
+            el.set("style", new_style)
+        else:
+            del el.attrib["style"]
 
-        lxml.etree.cleanup_namespaces(root)
+    for el in inkscape_elements:
+        el.getparent().remove(el)
 
-        inkscape_css_re = re.compile(r"-inkscape-[^;]+;?\s*")
+    lxml.etree.cleanup_namespaces(root)
 
-        for el in root.xpath("//*[@style]"):
-            style_text = el.get("style")
+    lxml.etree.indent(root, space="    ")
 
-            new_style = inkscape_css_re.sub("", style_text).strip()
+    formatted = lxml.etree.tostring(
+        root,
+        encoding="utf-8",
+        xml_declaration=True,
+        pretty_print=True,
+    )
+    formatted = formatted.rstrip(b"\n") + b"\n"
 
-            new_style = new_style.rstrip(";")
+    if formatted == svg_content:
+        return Success(filepath)
 
-            if new_style:
-                el.set("style", new_style)
-            else:
-                del el.attrib["style"]
+    with open(filepath, "wb") as file:
+        file.write(formatted)
 
-        lxml.etree.indent(root, space="    ")
+    return Fix(filepath, "Formatted SVG file")
 
-        formatted = lxml.etree.tostring(
-            root,
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
-        formatted = formatted.rstrip(b"\n") + b"\n"
 
-        if formatted == svg_content:
-            yield Success(filepath)
-            continue
+def check_svg_formatting():
+    """Check that SVG files are properly formatted."""
+    yield from _map_formatter(_format_svg_file, _find_files(".svg"), "svg-formatting")
 
-        with open(filepath, "wb") as file:
-            file.write(formatted)
 
-        yield Fix(filepath, "Formatted SVG file")
+def _format_xml_file(filepath: Path) -> Result:
+    with open(filepath, "rb") as file:
+        xml_content = file.read()
+
+    try:
+        tree = lxml.etree.fromstring(xml_content, parser=_XML_PARSER)
+    except Exception as e:
+        return Failure(filepath, f"Could not parse XML file: {e}")
+
+    root = lxml.etree.ElementTree(tree)
+
+    lxml.etree.indent(root, space="  ")
+
+    formatted = lxml.etree.tostring(
+        root,
+        encoding="utf-8",
+        xml_declaration=False,
+        pretty_print=True,
+    )
+    formatted = formatted.rstrip(b"\n") + b"\n"
+
+    if formatted == xml_content:
+        return Success(filepath)
+
+    with open(filepath, "wb") as file:
+        file.write(formatted)
+
+    return Fix(filepath, "Formatted XML file")
 
 
 def check_xml_formatting():
     """Check that XML files are properly formatted."""
-    for filepath in _find_files(".xml"):
-        with open(filepath, "rb") as file:
-            xml_content = file.read()
+    yield from _map_formatter(_format_xml_file, _find_files(".xml"), "xml-formatting")
 
-        # Using `lxml` over `xml` built-in module because it can preserve root comments.
-        parser = lxml.etree.XMLParser(remove_comments=False, no_network=True)
 
-        try:
-            tree = lxml.etree.fromstring(xml_content, parser=parser)
-        except Exception as e:
-            yield Failure(filepath, f"Could not parse XML file: {e}")
-            continue
+def _num_unit(v: str) -> tuple[float, str]:
+    v = v.strip()
+    i = len(v)
+    while i and v[i - 1] in _UNIT_CHARS:
+        i -= 1
+    return float(v[:i]), v[i:]
 
-        root = lxml.etree.ElementTree(tree)
 
-        lxml.etree.indent(root, space="  ")
+def _conv_unit(v: float, unit: str) -> float:
+    try:
+        return float(v) * _UNIT_FACTORS[unit]
+    except KeyError:
+        raise ValueError(f"Unsupported unit: {unit}") from None
 
-        formatted = lxml.etree.tostring(
-            root,
-            encoding="utf-8",
-            xml_declaration=False,
-            pretty_print=True,
-        )
-        formatted = formatted.rstrip(b"\n") + b"\n"
 
-        if formatted == xml_content:
-            yield Success(filepath)
+def _read_root_attributes(filepath: Path) -> dict[str, str]:
+    """Stream-parse an XML file and return the attributes of its root element."""
+    attributes: dict[str, str] | None = None
+
+    # The whole document is still parsed so malformed files are reported, but
+    # elements are discarded as soon as they are closed to bound memory usage.
+    for event, el in lxml.etree.iterparse(
+        str(filepath), events=("start", "end"), no_network=True
+    ):
+        if event == "start":
+            if attributes is None:
+                attributes = dict(el.attrib)
             continue
 
-        with open(filepath, "wb") as file:
-            file.write(formatted)
+        el.clear()
+        parent = el.getparent()
+        # The root element has no parent but may be preceded by comments.
+        while parent is not None and el.getprevious() is not None:
+            del parent[0]
 
-        yield Fix(filepath, "Formatted XML file")
+    return attributes
 
 
 def check_vector_image_dimensions():
     """Check that all SVG logos have correct dimensions."""
     for filepath in _iter_files("logos-svg"):
-        with open(filepath, "rb") as file:
-            svg_content = file.read()
-
-        parser = lxml.etree.XMLParser(
-            remove_comments=False,
-            no_network=True,
-            remove_blank_text=False,
-        )
-
         try:
-            tree = lxml.etree.fromstring(svg_content, parser=parser)
+            attributes = _read_root_attributes(filepath)
         except Exception as e:
             yield Failure(filepath, f"Could not parse SVG file: {e}")
             continue
 
-        svg = lxml.etree.ElementTree(tree)
-
-        root = svg.getroot()
-
-        def num_unit(v):
-            m = re.match(r"([\d.]+)([a-z%]*)", v.strip())
-            return float(m.group(1)), m.group(2)
-
-        def conv_unit(v, unit):
-            if unit == "px" or unit == "":
-                return float(v)
-            elif unit == "pt":
-                return float(v) * 1.25
-            elif unit == "pc":
-                return float(v) * 15
-            elif unit == "in":
-                return float(v) * 96
-            elif unit == "cm":
-                return float(v) * 96 / 2.54
-            elif unit == "mm":
-                return float(v) * 96 / 25.4
-            else:
-                raise ValueError(f"Unsupported unit: {unit}")
-
-        view_box = root.get("viewBox")
-        width = root.get("width")
-        height = root.get("height")
-        fixed = False
+        view_box = attributes.get("viewBox")
+        width = attributes.get("width")
+        height = attributes.get("height")
+        changes: dict[str, str] = {}
 
         if not view_box and (not width or not height):
             yield Failure(filepath, "SVG must have a viewBox or both width and height")
@@ -291,30 +444,39 @@ def check_vector_image_dimensions():
         if not width or not height:
             _, _, w, h = map(float, view_box.replace(",", " ").split())
         else:
-            w = conv_unit(*num_unit(width))
-            h = conv_unit(*num_unit(height))
+            try:
+                w = _conv_unit(*_num_unit(width))
+                h = _conv_unit(*_num_unit(height))
+            except ValueError as e:
+                yield Failure(filepath, f"Invalid width or height: {e}")
+                continue
 
         if not view_box:
-            root.set("viewBox", f"0 0 {w} {h}")
-            fixed = True
+            changes["viewBox"] = f"0 0 {w} {h}"
 
         target_w, target_h = 600, 300
 
         if w / h > target_w / target_h:
             if w != target_w:
-                root.set("width", str(target_w))
-                root.set("height", str(h * target_w / w))
-                fixed = True
+                changes["width"] = str(target_w)
+                changes["height"] = str(h * target_w / w)
         else:
             if h != target_h:
-                root.set("height", str(target_h))
-                root.set("width", str(w * target_h / h))
-                fixed = True
+                changes["height"] = str(target_h)
+                changes["width"] = str(w * target_h / h)
 
-        if not fixed:
+        if not changes:
             yield Success(filepath)
             continue
 
+        with open(filepath, "rb") as file:
+            svg_content = file.read()
+
+        root = lxml.etree.fromstring(svg_content, parser=_SVG_PARSER)
+
+        for name, value in changes.items():
+            root.set(name, value)
+
         lxml.etree.indent(root, space="    ")
 
         formatted = lxml.etree.tostring(
@@ -335,15 +497,21 @@ def check_vector_image_dimensions():
         yield Fix(filepath, "Rescaled SVG")
 
 
+def _check_raster_image_dimensions(filepath: Path) -> Result:
+    with Image.open(filepath) as img:
+        if img.size != (1920, 1080):
+            return Failure(filepath, f"Invalid dimensions: {img.size}")
+        return Success(filepath)
+
+
 def check_raster_image_dimensions():
     """Check that all background and overlays have correct dimensions."""
     for dir in ["backgrounds", "overlays"]:
-        for f in _iter_files(dir):
-            with Image.open(f) as img:
-                if img.size != (1920, 1080):
-                    yield Failure(f, f"Invalid dimensions: {img.size}")
-                else:
-                    yield Success(f)
+        yield from _map_files(
+            _check_raster_image_dimensions,
+            _iter_files(dir),
+            executor_type=ThreadPoolExecutor,
+        )
 
 
 def check_systems_are_complete():
@@ -393,6 +561,12 @@ def check_file_extensions():
                 yield Success(file)
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_xml(filepath: Path) -> lxml.etree._ElementTree:
+    """Parse an XML file once, sharing the tree between the checks reading it."""
+    return lxml.etree.parse(filepath)
+
+
 def check_metadata_is_complete():
     """Check that all required variables in systems metadata are present."""
 
@@ -407,7 +581,7 @@ def check_metadata_is_complete():
     ]
 
     for filepath in _iter_files("metadata"):
-        tree = lxml.etree.parse(filepath)
+        tree = _parse_xml(filepath)
         variables = tree.find("variables")
 
         if variables is None:
@@ -433,7 +607,7 @@ def check_all_variables_fully_translated():
 
     theme_lang = _base_dir() / "_inc" / "ui-components" / "theme-lang.xml"
 
-    tree = lxml.etree.parse(theme_lang)
+    tree = _parse_xml(theme_lang)
 
     def get_child_tags(tree) -> set[str]:
         required_tags: set[str] = set()
@@ -474,7 +648,7 @@ def check_all_systems_fully_translated():
 
     theme_lang = _base_dir() / "_inc" / "ui-components" / "theme-lang.xml"
 
-    tree = lxml.etree.parse(theme_lang)
+    tree = _parse_xml(theme_lang)
 
     required_langs: set[str] = set()
 
@@ -489,7 +663,7 @@ def check_all_systems_fully_translated():
         return
 
     for filepath in _iter_files("metadata"):
-        tree = lxml.etree.parse(filepath)
+        tree = _parse_xml(filepath)
         variables = tree.findall("variables")
 
         expected_langs = required_langs.copy()
@@ -519,7 +693,7 @@ def check_no_missing_collections():
 
     system_collections: list[Path] = []
     for filepath in _iter_files("metadata"):
-        tree = lxml.etree.parse(filepath)
+        tree = _parse_xml(filepath)
         variables = tree.find("variables")
         hardware = variables.find("systemHardwareType")
 
@@ -549,13 +723,37 @@ def check_no_missing_collections():
         )
 
 
+def _phash_image(filepath: Path) -> imagehash.ImageHash:
+    with Image.open(filepath) as img:
+        return imagehash.phash(img)
+
+
+def _phash_cache_key(filepath: Path) -> str:
+    stat = filepath.stat()
+    return f"{filepath.relative_to(_base_dir())}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
 def check_duplicated_backgrounds():
     """Check that no two background images are visually the same."""
     hash_dict: dict[imagehash.ImageHash, Path] = {}
 
-    for filepath in _iter_files("backgrounds"):
-        with Image.open(filepath) as img:
-            img_hash = imagehash.phash(img)
+    files = list(_iter_files("backgrounds"))
+    keys = [_phash_cache_key(filepath) for filepath in files]
+
+    cache = _load_cache("phash")
+    missing = [filepath for filepath, key in zip(files, keys) if key not in cache]
+
+    if missing or len(cache) != len(keys):
+        hashes = _map_files(_phash_image, missing, executor_type=ThreadPoolExecutor)
+
+        for filepath, img_hash in zip(missing, hashes):
+            cache[_phash_cache_key(filepath)] = str(img_hash)
+
+        # Only keep entries for the current backgrounds, dropping stale ones.
+        _save_cache("phash", {key: cache[key] for key in keys})
+
+    for filepath, key in zip(files, keys):
+        img_hash = imagehash.hex_to_hash(cache[key])
 
         if img_hash in hash_dict:
             other_file = hash_dict[img_hash]
@@ -568,59 +766,90 @@ def check_duplicated_backgrounds():
             yield Success(filepath)
 
 
-def check_overlays_match_their_backgrounds():
-    """Check that overlay images match their corresponding background images."""
-    for overlay_file in _iter_files("overlays"):
-        background_file = _base_dir() / "_inc" / "backgrounds" / overlay_file.name
+def _phash_blocks(gray: Image.Image, boxes: list[tuple[int, int, int, int]]):
+    """Compute the `imagehash.phash` bits of several regions of a grayscale image."""
+    pixels = np.stack(
+        [
+            np.asarray(gray.crop(box).resize((32, 32), Image.Resampling.LANCZOS))
+            for box in boxes
+        ]
+    )
 
-        if not background_file.exists():
-            yield Failure(overlay_file, "Missing background")
-            continue
+    dct = scipy.fft.dctn(pixels.astype(np.float64), axes=(1, 2))
+    low_freq = dct[:, :8, :8]
+    median = np.median(low_freq.reshape(len(boxes), -1), axis=1)
 
-        with Image.open(overlay_file).convert("RGBA") as overlay_image:
-            overlay_alpha = overlay_image.split()[-1]
-            overlay_mask = overlay_alpha.point(lambda p: 255 if p == 255 else 0)
+    return low_freq > median[:, np.newaxis, np.newaxis]
 
-            overlay_masked = Image.new("RGB", overlay_image.size, (255, 255, 255))
-            overlay_masked.paste(overlay_image, mask=overlay_mask)
 
-        with Image.open(background_file).convert("RGBA") as background_image:
-            background_masked = Image.new("RGB", background_image.size, (255, 255, 255))
-            background_masked.paste(background_image, mask=overlay_mask)
+def _check_overlay_matches_background(overlay_file: Path) -> Result:
+    background_file = _base_dir() / "_inc" / "backgrounds" / overlay_file.name
 
-        width, height = overlay_image.size
-        block_distances = []
+    if not background_file.exists():
+        return Failure(overlay_file, "Missing background")
 
-        for y in range(0, height, 256):
-            for x in range(0, width, 256):
-                box = (x, y, x + 256, y + 256)
+    with Image.open(overlay_file).convert("RGBA") as overlay_image:
+        overlay_alpha = overlay_image.split()[-1]
+        overlay_mask = overlay_alpha.point([0] * 255 + [255])
 
-                mask_block = overlay_mask.crop(box)
+        overlay_masked = Image.new("RGB", overlay_image.size, (255, 255, 255))
+        overlay_masked.paste(overlay_image, mask=overlay_mask)
 
-                # Blocks that are fully transparent must be ignored.
-                if not any(mask_block.get_flattened_data()):
-                    continue
+    with Image.open(background_file).convert("RGBA") as background_image:
+        background_masked = Image.new("RGB", background_image.size, (255, 255, 255))
+        background_masked.paste(background_image, mask=overlay_mask)
 
-                overlay_block = overlay_masked.crop(box)
-                background_block = background_masked.crop(box)
+    width, height = overlay_image.size
+    rows, cols = -(-height // 256), -(-width // 256)
 
-                overlay_hash = imagehash.phash(overlay_block)
-                background_hash = imagehash.phash(background_block)
+    # Pad the mask to whole blocks so all of them are reduced in a single pass.
+    mask = np.zeros((rows * 256, cols * 256), dtype=bool)
+    mask[:height, :width] = np.asarray(overlay_mask)
+    opaque_blocks = mask.reshape(rows, 256, cols, 256).any(axis=(1, 3))
 
-                block_distances.append(background_hash - overlay_hash)
+    if not opaque_blocks.any():
+        return Failure(overlay_file, "Overlay is fully transparent")
 
-        if max(block_distances) > 5:
-            yield Failure(overlay_file, "Overlay does not match background visually")
-        else:
-            yield Success(overlay_file)
+    overlay_gray = overlay_masked.convert("L")
+    background_gray = background_masked.convert("L")
+
+    # Blocks are compared one row at a time, so a mismatch stops the scan early.
+    for y, row in enumerate(opaque_blocks):
+        # Blocks that are fully transparent must be ignored.
+        boxes = [
+            (x * 256, y * 256, x * 256 + 256, y * 256 + 256)
+            for x in np.flatnonzero(row)
+        ]
+
+        if not boxes:
+            continue
+
+        overlay_hashes = _phash_blocks(overlay_gray, boxes)
+        background_hashes = _phash_blocks(background_gray, boxes)
+
+        distances = np.count_nonzero(overlay_hashes != background_hashes, axis=(1, 2))
+
+        if distances.max() > 5:
+            return Failure(overlay_file, "Overlay does not match background visually")
+
+    return Success(overlay_file)
+
+
+def check_overlays_match_their_backgrounds():
+    """Check that overlay images match their corresponding background images."""
+    yield from _map_files(_check_overlay_matches_background, _iter_files("overlays"))
 
 
 def verify_theme_quality():
-    checks: list[CheckFunction] = [
+    # These checks rewrite files in place, some of which are shared between them
+    # or read by other checks, so they must run one after the other.
+    fixing_checks: list[CheckFunction] = [
         check_vector_image_dimensions,
-        check_raster_image_dimensions,
         check_svg_formatting,
         check_xml_formatting,
+    ]
+    checks: list[CheckFunction] = [
+        check_raster_image_dimensions,
         check_systems_are_complete,
         check_all_images_have_system,
         check_file_extensions,
@@ -631,23 +860,61 @@ def verify_theme_quality():
         check_duplicated_backgrounds,
         check_overlays_match_their_backgrounds,
     ]
+    # These checks spread their per-file work over a pool of their own, so they run
+    # from this process instead of nesting that pool inside a worker.
+    pooled_checks = {
+        check_raster_image_dimensions,
+        check_duplicated_backgrounds,
+        check_overlays_match_their_backgrounds,
+    }
+
+    # These checks read the same XML files, running them in a single worker lets
+    # them share the trees cached by `_parse_xml`.
+    xml_checks = {
+        check_metadata_is_complete,
+        check_all_variables_fully_translated,
+        check_all_systems_fully_translated,
+        check_no_missing_collections,
+    }
 
     console = Console(highlighter=None)
     succeeded_count = 0
 
-    for check in checks:
-        succeeded_count += _run_check(check)
+    for check in fixing_checks:
+        succeeded_count += _run_check(check, functools.partial(_collect_results, check))
+
+    with (
+        ProcessPoolExecutor() as executor,
+        ProcessPoolExecutor(max_workers=1) as xml_executor,
+    ):
+        futures = {
+            check: (xml_executor if check in xml_checks else executor).submit(
+                _collect_results, check
+            )
+            for check in checks
+            if check not in pooled_checks
+        }
+
+        for check in checks:
+            if check in futures:
+                get_results = futures[check].result
+            else:
+                get_results = functools.partial(_collect_results, check)
+
+            succeeded_count += _run_check(check, get_results)
+
+    total_count = len(fixing_checks) + len(checks)
 
-    if succeeded_count != len(checks):
+    if succeeded_count != total_count:
         console.print(
             f"[bold]Final result:[/] [red bold]FAILURE[/] "
-            f"({succeeded_count} out of {len(checks)} checks passed)."
+            f"({succeeded_count} out of {total_count} checks passed)."
         )
         return False
 
     console.print(
         f"[bold]Final result:[/] [green bold]SUCCESS[/] "
-        f"({succeeded_count} out of {len(checks)} checks passed)."
+        f"({succeeded_count} out of {total_count} checks passed)."
     )
     return True
 